@@ -0,0 +1,87 @@
+"""CLI 임포트 시간 벤치마크.
+
+``python -X importtime``으로 ``litestar_boilerplate.cli`` 임포트 시간을 측정하고, 예산을 넘거나
+지연 로딩해야 할 모듈이 시작 시점에 임포트되면 0이 아닌 종료 코드를 반환합니다.
+
+사용법:
+    python benchmarks/import_time.py [--budget-ms 100] [--runs 5]
+"""
+
+import argparse
+import subprocess
+import sys
+from pathlib import Path
+from typing import Final
+
+TARGET_MODULE: Final[str] = "litestar_boilerplate.cli"
+
+# CLI 시작 시 임포트되면 안 되는 모듈 (각 명령에서 필요할 때 임포트)
+LAZY_MODULES: Final[tuple[str, ...]] = (
+    "rich",
+    "jinja2",
+    "litestar_boilerplate.batch",
+    "litestar_boilerplate.readme_generator",
+    "litestar_boilerplate.generators.base",
+    "litestar_boilerplate.generators.layered",
+    "litestar_boilerplate.generators.ddd_lite",
+    "litestar_boilerplate.generators.feature_based",
+)
+
+SRC_DIR: Final[Path] = Path(__file__).resolve().parent.parent / "src"
+
+
+def measure_import(module: str = TARGET_MODULE) -> tuple[float, set[str]]:
+    """새 인터프리터에서 모듈을 임포트하고 누적 임포트 시간(ms)과 임포트된 모듈 목록을 반환합니다."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=SRC_DIR,
+    )
+
+    cumulative_us = 0
+    imported: set[str] = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = (part.strip() for part in line.removeprefix("import time:").split("|"))
+        if not cumulative.isdigit():
+            continue
+        imported.add(name)
+        if name == module:
+            cumulative_us = int(cumulative)
+
+    return cumulative_us / 1000, imported
+
+
+def main() -> int:
+    """벤치마크를 실행하고 예산 초과 여부를 종료 코드로 반환합니다."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--budget-ms", type=float, default=100.0, help="허용하는 최대 임포트 시간 (ms)")
+    parser.add_argument("--runs", type=int, default=5, help="측정 횟수 (최솟값을 사용)")
+    args = parser.parse_args()
+
+    timings: list[float] = []
+    imported: set[str] = set()
+    for _ in range(args.runs):
+        elapsed, imported = measure_import()
+        timings.append(elapsed)
+
+    best = min(timings)
+    print(f"{TARGET_MODULE}: best {best:.1f} ms, worst {max(timings):.1f} ms over {args.runs} runs (budget {args.budget_ms:.0f} ms)")
+
+    eager = sorted(name for name in imported if any(name == lazy or name.startswith(f"{lazy}.") for lazy in LAZY_MODULES))
+    failed = False
+    if eager:
+        print(f"FAIL: lazily loaded modules imported at startup: {', '.join(eager)}")
+        failed = True
+    if best > args.budget_ms:
+        print(f"FAIL: import time {best:.1f} ms exceeds budget {args.budget_ms:.0f} ms")
+        failed = True
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,247 @@
+"""CLI 및 제너레이터 벤치마크 실행기.
+
+다음 항목을 측정하여 JSON으로 저장하고, 이전 결과(기준선)와 비교해 성능 저하를 찾습니다.
+
+- ``cli:<명령>``: 새 인터프리터에서 각 CLI 하위 명령을 실행하는 콜드 스타트 시간
+- ``generate:<타입>``: 각 제너레이터의 ``generate()`` 실행 시간, 파일 시스템 호출 수, 최대 메모리
+- ``readme``: ``generate_readme_files()`` 실행 시간, 파일 시스템 호출 수, 최대 메모리
+
+파일 시스템 호출 수는 ``sys.addaudithook``으로 관찰되는 ``open``, ``os.mkdir``, ``os.rename``
+등의 감사 이벤트 수입니다. ``stat`` 계열 호출은 감사 이벤트가 없으므로 포함되지 않습니다.
+
+사용법:
+    python benchmarks/run.py --output results.json
+    python benchmarks/run.py --compare baseline.json --threshold 0.2
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from collections.abc import Callable
+from datetime import UTC, datetime
+from functools import partial
+from pathlib import Path
+from typing import Any, Final
+
+SRC_DIR: Final[Path] = Path(__file__).resolve().parent.parent / "src"
+
+# 콜드 스타트를 측정할 CLI 하위 명령
+CLI_COMMANDS: Final[dict[str, list[str]]] = {
+    "--version": ["--version"],
+    "--help": ["--help"],
+    "list-templates": ["list-templates"],
+    "info": ["info", "layered"],
+    "create --help": ["create", "--help"],
+    "create-batch --help": ["create-batch", "--help"],
+}
+
+# 파일 시스템 호출로 집계하는 감사 이벤트
+FS_AUDIT_EVENTS: Final[frozenset[str]] = frozenset(
+    {
+        "open",
+        "os.mkdir",
+        "os.rename",
+        "os.remove",
+        "os.rmdir",
+        "os.chmod",
+        "os.utime",
+        "os.listdir",
+        "os.scandir",
+        "os.truncate",
+        "os.link",
+        "os.symlink",
+        "shutil.rmtree",
+    }
+)
+
+# 비교 대상 지표 (값이 클수록 나쁨)
+COMPARED_METRICS: Final[tuple[str, ...]] = ("median_ms", "syscalls", "peak_kib")
+
+
+class SyscallCounter:
+    """감사 훅으로 파일 시스템 호출 수를 세는 카운터.
+
+    감사 훅은 제거할 수 없으므로 프로세스당 한 번만 설치하고, 측정 구간마다 ``reset``합니다.
+    """
+
+    def __init__(self) -> None:
+        """카운터를 초기화하고 감사 훅을 설치합니다."""
+        self.count = 0
+        self._lock = threading.Lock()
+        sys.addaudithook(self._hook)
+
+    def reset(self) -> None:
+        """카운트를 0으로 되돌립니다."""
+        with self._lock:
+            self.count = 0
+
+    def _hook(self, event: str, args: tuple[Any, ...]) -> None:
+        if event in FS_AUDIT_EVENTS:
+            with self._lock:
+                self.count += 1
+
+
+def summarize(timings: list[float]) -> dict[str, float]:
+    """측정 시간(초) 목록을 밀리초 단위 통계로 요약합니다."""
+    return {
+        "min_ms": round(min(timings) * 1000, 3),
+        "median_ms": round(statistics.median(timings) * 1000, 3),
+        "max_ms": round(max(timings) * 1000, 3),
+    }
+
+
+def bench_cli(rounds: int) -> dict[str, dict[str, Any]]:
+    """각 CLI 하위 명령의 콜드 스타트 시간을 측정합니다."""
+    results: dict[str, dict[str, Any]] = {}
+    for name, args in CLI_COMMANDS.items():
+        timings: list[float] = []
+        for _ in range(rounds):
+            start = time.perf_counter()
+            subprocess.run(
+                [sys.executable, "-m", "litestar_boilerplate.cli", "--language", "en", *args],
+                capture_output=True,
+                check=True,
+                cwd=SRC_DIR,
+            )
+            timings.append(time.perf_counter() - start)
+        results[f"cli:{name}"] = {"rounds": rounds, **summarize(timings)}
+    return results
+
+
+def bench_call(func: Callable[[Path], object], rounds: int, counter: SyscallCounter) -> dict[str, Any]:
+    """``func``를 새 임시 디렉토리에서 반복 실행하며 시간, 호출 수, 최대 메모리를 측정합니다.
+
+    첫 실행(템플릿 컴파일 등)은 워밍업으로 보고 통계에서 제외합니다.
+    """
+    timings: list[float] = []
+    syscalls: list[int] = []
+    peaks: list[int] = []
+
+    with tempfile.TemporaryDirectory(prefix="litestar-bench-") as tmp:
+        for index in range(rounds + 1):
+            target = Path(tmp) / f"run-{index}"
+            tracemalloc.start()
+            counter.reset()
+            start = time.perf_counter()
+            func(target)
+            elapsed = time.perf_counter() - start
+            calls = counter.count
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            if index == 0:
+                continue
+            timings.append(elapsed)
+            syscalls.append(calls)
+            peaks.append(peak)
+
+    return {
+        "rounds": rounds,
+        **summarize(timings),
+        "syscalls": max(syscalls),
+        "peak_kib": round(max(peaks) / 1024, 1),
+    }
+
+
+def bench_generators(rounds: int, counter: SyscallCounter) -> dict[str, dict[str, Any]]:
+    """모든 제너레이터의 ``generate()``를 측정합니다."""
+    from litestar_boilerplate.generators import GeneratorFactory
+
+    results: dict[str, dict[str, Any]] = {}
+    for template_type in GeneratorFactory.get_available_types():
+        generator = GeneratorFactory.create(template_type)
+        results[f"generate:{template_type}"] = bench_call(partial(generator.generate, "bench_project"), rounds, counter)
+    return results
+
+
+def bench_readme(rounds: int, counter: SyscallCounter) -> dict[str, dict[str, Any]]:
+    """``generate_readme_files()``를 측정합니다."""
+    from litestar_boilerplate.readme_generator import generate_readme_files
+
+    return {"readme": bench_call(generate_readme_files, rounds, counter)}
+
+
+def compare(current: dict[str, Any], baseline: dict[str, Any], threshold: float) -> list[str]:
+    """기준선보다 ``threshold`` 비율 이상 나빠진 지표 목록을 반환합니다."""
+    regressions: list[str] = []
+    for name, metrics in current["results"].items():
+        previous = baseline.get("results", {}).get(name)
+        if previous is None:
+            continue
+        for metric in COMPARED_METRICS:
+            if metric not in metrics or not previous.get(metric):
+                continue
+            change = metrics[metric] / previous[metric] - 1
+            if change > threshold:
+                regressions.append(f"{name} {metric}: {previous[metric]} -> {metrics[metric]} (+{change:.0%})")
+    return regressions
+
+
+def print_results(results: dict[str, dict[str, Any]]) -> None:
+    """측정 결과를 표 형태로 출력합니다."""
+    print(f"{'benchmark':<28} {'median ms':>10} {'min ms':>10} {'syscalls':>9} {'peak KiB':>10}")
+    for name, metrics in results.items():
+        print(
+            f"{name:<28} {metrics['median_ms']:>10.2f} {metrics['min_ms']:>10.2f} "
+            f"{metrics.get('syscalls', '-'):>9} {metrics.get('peak_kib', '-'):>10}"
+        )
+
+
+def main() -> int:
+    """벤치마크를 실행하고 기준선 대비 성능 저하가 있으면 1을 반환합니다."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=5, help="항목별 측정 횟수")
+    parser.add_argument("--only", choices=["cli", "generate", "readme"], action="append", help="실행할 벤치마크 그룹 (반복 가능)")
+    parser.add_argument("--output", type=Path, help="결과를 저장할 JSON 파일 경로")
+    parser.add_argument("--compare", type=Path, help="비교할 기준선 JSON 파일 경로")
+    parser.add_argument("--threshold", type=float, default=0.2, help="성능 저하로 판단하는 증가 비율 (기본값: 0.2)")
+    args = parser.parse_args()
+
+    sys.path.insert(0, str(SRC_DIR))
+    groups = set(args.only or ["cli", "generate", "readme"])
+    counter = SyscallCounter()
+
+    results: dict[str, dict[str, Any]] = {}
+    if "cli" in groups:
+        results.update(bench_cli(args.rounds))
+    if "generate" in groups:
+        results.update(bench_generators(args.rounds, counter))
+    if "readme" in groups:
+        results.update(bench_readme(args.rounds, counter))
+
+    report = {
+        "meta": {
+            "created_at": datetime.now(UTC).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "results": results,
+    }
+    print_results(results)
+
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+        print(f"\nSaved results to {args.output}")
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        regressions = compare(report, baseline, args.threshold)
+        if regressions:
+            print(f"\nRegressions over {args.threshold:.0%} against {args.compare}:")
+            for regression in regressions:
+                print(f"  {regression}")
+            return 1
+        print(f"\nNo regressions over {args.threshold:.0%} against {args.compare}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
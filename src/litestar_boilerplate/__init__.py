@@ -9,12 +9,10 @@ __email__ = "edc1010@gmail.com"
 
 from typing import Final
 
-# 지원하는 템플릿 타입
-SUPPORTED_TEMPLATES: Final[list[str]] = [
-    "layered",
-    "ddd-lite",
-    "feature-based",
-]
+from .generators.registry import BUILTIN_GENERATORS
+
+# 기본 제공 템플릿 타입 (플러그인을 포함한 목록은 ``GeneratorFactory.get_available_types()``)
+SUPPORTED_TEMPLATES: Final[list[str]] = list(BUILTIN_GENERATORS)
 
 __all__ = [
     "SUPPORTED_TEMPLATES",
@@ -0,0 +1,149 @@
+"""매니페스트 기반 일괄 프로젝트 생성 모듈."""
+
+import json
+import time
+import tomllib
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Final
+
+from .generators import GeneratorFactory
+
+# 매니페스트 항목에서 지원하는 옵션
+SUPPORTED_OPTIONS: Final[frozenset[str]] = frozenset({"force", "incremental", "workers"})
+
+
+@dataclass(frozen=True)
+class BatchEntry:
+    """일괄 생성할 프로젝트 한 개."""
+
+    name: str
+    template_type: str
+    output: Path = Path(".")
+    options: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def output_path(self) -> Path:
+        """프로젝트가 생성될 경로를 반환합니다."""
+        return self.output / self.name
+
+
+@dataclass(frozen=True)
+class BatchResult:
+    """프로젝트 한 개의 생성 결과."""
+
+    entry: BatchEntry
+    duration: float
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        """생성에 성공했는지 여부를 반환합니다."""
+        return self.error is None
+
+
+def load_batch_manifest(manifest_path: Path) -> list[BatchEntry]:
+    """YAML/JSON/TOML 매니페스트 파일을 읽습니다.
+
+    매니페스트는 ``projects`` 목록(또는 최상위 목록)에 ``name``, ``type``, ``output``,
+    ``options`` 키를 가진 항목을 담습니다. 상대 ``output`` 경로는 매니페스트 파일 위치를
+    기준으로 해석됩니다.
+
+    Args:
+        manifest_path: 매니페스트 파일 경로
+
+    Returns:
+        일괄 생성할 프로젝트 목록
+
+    Raises:
+        ValueError: 매니페스트 형식이 올바르지 않은 경우
+    """
+    data = _parse_manifest(manifest_path)
+    items = data.get("projects") if isinstance(data, dict) else data
+    if not isinstance(items, list) or not items:
+        raise ValueError(f"매니페스트에 프로젝트 목록이 없습니다: {manifest_path}")
+
+    available = GeneratorFactory.get_available_types()
+    base_dir = manifest_path.parent
+    entries: list[BatchEntry] = []
+    for index, item in enumerate(items, start=1):
+        if not isinstance(item, dict) or not item.get("name") or not item.get("type"):
+            raise ValueError(f"{index}번째 항목에 name과 type이 필요합니다")
+        if item["type"] not in available:
+            raise ValueError(f"{index}번째 항목: 지원하지 않는 템플릿 타입: {item['type']}. 사용 가능한 타입: {', '.join(available)}")
+
+        options = item.get("options") or {}
+        unknown = set(options) - SUPPORTED_OPTIONS
+        if unknown:
+            raise ValueError(f"{index}번째 항목: 지원하지 않는 옵션: {', '.join(sorted(unknown))}")
+
+        entries.append(
+            BatchEntry(
+                name=str(item["name"]),
+                template_type=str(item["type"]),
+                output=base_dir / str(item.get("output", ".")),
+                options=dict(options),
+            )
+        )
+
+    names = [entry.output_path.resolve() for entry in entries]
+    if len(set(names)) != len(names):
+        raise ValueError("매니페스트에 같은 경로로 생성되는 프로젝트가 중복되어 있습니다")
+    return entries
+
+
+def run_batch(entries: list[BatchEntry], max_processes: int | None = None) -> list[BatchResult]:
+    """프로젝트들을 한 프로세스 풀에서 일괄 생성합니다.
+
+    Args:
+        entries: 일괄 생성할 프로젝트 목록
+        max_processes: 프로세스 풀 크기 (기본값: CPU 수)
+
+    Returns:
+        매니페스트 순서와 같은 순서의 생성 결과 목록
+    """
+    if max_processes == 1 or len(entries) <= 1:
+        return [generate_entry(entry) for entry in entries]
+
+    with ProcessPoolExecutor(max_workers=max_processes) as executor:
+        return list(executor.map(generate_entry, entries))
+
+
+def generate_entry(entry: BatchEntry) -> BatchResult:
+    """매니페스트 항목 한 개를 생성합니다.
+
+    프로세스 풀 워커에서 실행되므로 예외를 던지지 않고 결과에 오류 메시지를 담습니다.
+    """
+    start = time.perf_counter()
+    try:
+        output_path = entry.output_path
+        generator = GeneratorFactory.create(entry.template_type, max_workers=entry.options.get("workers"))
+        if entry.options.get("incremental"):
+            generator.update(entry.name, output_path)
+        elif output_path.exists() and not entry.options.get("force"):
+            raise FileExistsError(f"디렉토리가 이미 존재합니다: {output_path}")
+        else:
+            generator.generate(entry.name, output_path)
+    except Exception as e:
+        return BatchResult(entry=entry, duration=time.perf_counter() - start, error=str(e))
+    return BatchResult(entry=entry, duration=time.perf_counter() - start)
+
+
+def _parse_manifest(manifest_path: Path) -> Any:
+    """확장자에 따라 매니페스트 파일을 파싱합니다."""
+    suffix = manifest_path.suffix.lower()
+    content = manifest_path.read_text(encoding="utf-8")
+
+    if suffix == ".json":
+        return json.loads(content)
+    if suffix == ".toml":
+        return tomllib.loads(content)
+    if suffix in (".yaml", ".yml"):
+        try:
+            import yaml
+        except ImportError as e:
+            raise ValueError("YAML 매니페스트를 읽으려면 PyYAML이 필요합니다: pip install 'litestar-boilerplate[yaml]'") from e
+        return yaml.safe_load(content)
+
+    raise ValueError(f"지원하지 않는 매니페스트 형식입니다: {manifest_path.name} (.yaml, .yml, .json, .toml)")
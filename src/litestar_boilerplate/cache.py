@@ -0,0 +1,30 @@
+"""사용자 캐시 디렉토리 모듈."""
+
+import os
+from pathlib import Path
+
+
+def get_cache_dir(*parts: str) -> Path | None:
+    """litestar-boilerplate 캐시 디렉토리를 반환합니다.
+
+    ``LITESTAR_BOILERPLATE_CACHE_DIR`` 환경변수가 있으면 그 경로를, 없으면
+    ``$XDG_CACHE_HOME/litestar-boilerplate`` (기본값: ``~/.cache/litestar-boilerplate``)를 사용합니다.
+
+    Args:
+        parts: 캐시 디렉토리 아래의 하위 경로
+
+    Returns:
+        생성된 캐시 디렉토리 경로 (생성할 수 없으면 ``None``)
+    """
+    override = os.environ.get("LITESTAR_BOILERPLATE_CACHE_DIR")
+    if override:
+        root = Path(override)
+    else:
+        root = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "litestar-boilerplate"
+
+    path = root.joinpath(*parts)
+    try:
+        path.mkdir(parents=True, exist_ok=True)
+    except OSError:
+        return None
+    return path
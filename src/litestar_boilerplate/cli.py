@@ -1,23 +1,32 @@
 """CLI 도구 메인 모듈."""
 
-import shutil
+import time
+from functools import cache
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 import click
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
 
 from . import SUPPORTED_TEMPLATES, __version__
 from .generators import GeneratorFactory
 from .i18n import Language, set_language, t
-from .readme_generator import generate_readme_files
 
 if TYPE_CHECKING:
+    from rich.console import Console
+
     from .generators.base import BaseGenerator
 
-console = Console()
+
+@cache
+def get_console() -> "Console":
+    """출력용 rich 콘솔을 반환합니다.
+
+    ``--version``이나 ``--help``처럼 출력이 필요 없는 호출의 시작 시간을 줄이기 위해
+    rich는 처음 사용할 때 임포트합니다.
+    """
+    from rich.console import Console
+
+    return Console()
 
 
 def language_callback(ctx: click.Context, param: click.Parameter, value: str) -> str:
@@ -32,6 +41,18 @@ def language_callback(ctx: click.Context, param: click.Parameter, value: str) ->
     return value
 
 
+def template_type_callback(ctx: click.Context, param: click.Parameter, value: str) -> str:
+    """템플릿 타입 콜백 함수.
+
+    사용 가능한 타입에는 플러그인 제너레이터도 포함되므로, 모든 명령(``--help`` 포함)이 임포트 시점에
+    레지스트리를 검색하지 않도록 ``click.Choice`` 대신 실제로 ``create``를 실행할 때 검증합니다.
+    """
+    available = GeneratorFactory.get_available_types()
+    if value not in available:
+        raise click.BadParameter(f"{value!r} is not one of {', '.join(map(repr, available))}.", ctx=ctx, param=param)
+    return value
+
+
 @click.group(invoke_without_command=True)
 @click.option(
     "--language",
@@ -56,27 +77,39 @@ def main(ctx: click.Context, version: bool) -> None:
 
 
 @main.command()
-@click.option("--type", "template_type", type=click.Choice(SUPPORTED_TEMPLATES), required=True, help="Template type to use")
+@click.option(
+    "--type",
+    "template_type",
+    required=True,
+    callback=template_type_callback,
+    help=f"Template type to use ({', '.join(SUPPORTED_TEMPLATES)} or a plugin template)",
+)
 @click.option("--name", "project_name", required=True, help="Project name")
 @click.option("--output", "output_dir", type=click.Path(), default=".", help="Output directory (default: current directory)")
 @click.option("--force", is_flag=True, help="Force creation even if directory exists")
-def create(template_type: str, project_name: str, output_dir: str, force: bool) -> None:
+@click.option("--incremental", is_flag=True, help="Only rewrite files whose content changed (keeps existing directory)")
+@click.option("--workers", "max_workers", type=click.IntRange(min=1), default=None, help="Number of file-writing worker threads")
+def create(template_type: str, project_name: str, output_dir: str, force: bool, incremental: bool, max_workers: int | None) -> None:
     """Create a new Litestar project."""
+    console = get_console()
     output_path = Path(output_dir) / project_name
 
+    if incremental:
+        _update_project(template_type, project_name, output_path, max_workers)
+        return
+
     if output_path.exists() and not force:
         console.print(f"[red]{t('messages.directory_exists')}[/red] '{output_path}'")
         console.print(t("messages.use_force"))
         raise click.Abort()
 
     if output_path.exists() and force:
-        console.print(f"[yellow]Warning:[/yellow] Removing existing directory '{output_path}'")
-        shutil.rmtree(output_path)
+        console.print(f"[yellow]Warning:[/yellow] Replacing existing directory '{output_path}'")
 
     console.print(f"[blue]{t('messages.creating_project')}[/blue] '{project_name}' with {template_type} template")
 
     try:
-        generator: BaseGenerator = GeneratorFactory.create(template_type)
+        generator: BaseGenerator = GeneratorFactory.create(template_type, max_workers=max_workers)
         generator.generate(project_name, output_path)
 
         console.print(f"[green]{t('messages.project_created')}[/green] at '{output_path}'")
@@ -96,9 +129,73 @@ def create(template_type: str, project_name: str, output_dir: str, force: bool)
         raise click.Abort() from e
 
 
+def _update_project(template_type: str, project_name: str, output_path: Path, max_workers: int | None) -> None:
+    """내용이 바뀐 파일만 다시 기록하여 프로젝트를 갱신합니다."""
+    console = get_console()
+    try:
+        generator: BaseGenerator = GeneratorFactory.create(template_type, max_workers=max_workers)
+        report = generator.update(project_name, output_path)
+    except Exception as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise click.Abort() from e
+
+    console.print(f"[green]{t('messages.project_updated')}[/green] at '{output_path}'")
+    console.print(
+        t(
+            "messages.update_summary",
+            created=len(report.created),
+            updated=len(report.updated),
+            unchanged=len(report.unchanged),
+        )
+    )
+    for path in report.written:
+        console.print(f"  [cyan]{path.as_posix()}[/cyan]")
+
+
+@main.command("create-batch")
+@click.argument("manifest", type=click.Path(exists=True, dir_okay=False, path_type=Path))
+@click.option("--processes", type=click.IntRange(min=1), default=None, help="Number of worker processes (default: CPU count)")
+def create_batch(manifest: Path, processes: int | None) -> None:
+    """Create multiple projects from a YAML/JSON/TOML manifest."""
+    from rich.table import Table
+
+    from .batch import load_batch_manifest, run_batch
+
+    console = get_console()
+    start = time.perf_counter()
+    try:
+        entries = load_batch_manifest(manifest)
+    except (OSError, ValueError) as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise click.Abort() from e
+
+    console.print(f"[blue]{t('messages.batch_started', count=len(entries))}[/blue]")
+    results = run_batch(entries, max_processes=processes)
+
+    table = Table(title=t("messages.batch_summary"))
+    table.add_column(t("messages.batch_project"), style="cyan", no_wrap=True)
+    table.add_column(t("messages.batch_template"), style="magenta")
+    table.add_column(t("messages.batch_status"))
+    table.add_column(t("messages.batch_duration"), justify="right")
+
+    for result in results:
+        status = "[green]OK[/green]" if result.ok else f"[red]{result.error}[/red]"
+        table.add_row(str(result.entry.output_path), result.entry.template_type, status, f"{result.duration:.2f}s")
+
+    console.print(table)
+
+    failed = sum(1 for result in results if not result.ok)
+    console.print(t("messages.batch_completed", succeeded=len(results) - failed, failed=failed, elapsed=time.perf_counter() - start))
+    if failed:
+        raise click.Abort()
+
+
 @main.command("list-templates")
 def list_templates() -> None:
     """List available templates."""
+    from rich.table import Table
+
+    console = get_console()
     table = Table(title=t("templates.available_templates"))
 
     table.add_column(t("templates.name"), style="cyan", no_wrap=True)
@@ -114,6 +211,12 @@ def list_templates() -> None:
     for template, desc, features in templates:
         table.add_row(template, desc, features)
 
+    # 엔트리 포인트로 등록된 플러그인 템플릿
+    for template in GeneratorFactory.get_available_types():
+        if template not in SUPPORTED_TEMPLATES:
+            doc = GeneratorFactory.get_generator_class(template).__doc__ or ""
+            table.add_row(template, doc.strip().splitlines()[0] if doc.strip() else "", "")
+
     console.print(table)
 
 
@@ -131,6 +234,9 @@ def info(template_name: str | None = None) -> None:
 @click.option("--output", "output_dir", type=click.Path(), default=".", help="Output directory (default: current directory)")
 def generate_readme(output_dir: str) -> None:
     """Generate README files in multiple languages."""
+    from .readme_generator import generate_readme_files
+
+    console = get_console()
     output_path = Path(output_dir)
 
     try:
@@ -147,6 +253,9 @@ def generate_readme(output_dir: str) -> None:
 
 def _show_template_info(template_name: str) -> None:
     """특정 템플릿의 상세 정보를 표시합니다."""
+    from rich.panel import Panel
+
+    console = get_console()
     template_key = template_name.replace("-", "-")
 
     console.print(
@@ -183,6 +292,7 @@ def _show_template_info(template_name: str) -> None:
 
 def _show_all_templates_info() -> None:
     """모든 템플릿의 상세 정보를 표시합니다."""
+    console = get_console()
     console.print(f"[bold blue]{t('templates.template_info')}[/bold blue]\n")
 
     for template_name in SUPPORTED_TEMPLATES:
@@ -1,30 +1,31 @@
 """제너레이터 팩토리 클래스."""
 
+from importlib import import_module
 from typing import TYPE_CHECKING, ClassVar
 
-from .ddd_lite import DddLiteGenerator
-from .feature_based import FeatureBasedGenerator
-from .layered import LayeredGenerator
+from .registry import load_registry
 
 if TYPE_CHECKING:
     from .base import BaseGenerator
 
 
 class GeneratorFactory:
-    """프로젝트 구조 제너레이터 팩토리."""
+    """프로젝트 구조 제너레이터 팩토리.
 
-    _generators: ClassVar[dict[str, type["BaseGenerator"]]] = {
-        "layered": LayeredGenerator,
-        "ddd-lite": DddLiteGenerator,
-        "feature-based": FeatureBasedGenerator,
-    }
+    제너레이터 클래스는 레지스트리에 ``모듈:클래스`` 경로로만 등록되어 있고, 실제로 필요할 때
+    임포트하여 CLI 시작 시 모든 제너레이터 모듈을 읽어들이지 않습니다. 레지스트리에는 기본 제공
+    제너레이터와 ``litestar_boilerplate.generators`` 엔트리 포인트로 등록된 플러그인이 포함됩니다.
+    """
+
+    _resolved: ClassVar[dict[str, type["BaseGenerator"]]] = {}
 
     @classmethod
-    def create(cls, template_type: str) -> "BaseGenerator":
+    def create(cls, template_type: str, max_workers: int | None = None) -> "BaseGenerator":
         """템플릿 타입에 따라 적절한 제너레이터를 생성합니다.
 
         Args:
             template_type: 생성할 템플릿 타입
+            max_workers: 파일 쓰기 워커 수 (기본값: 쓰기 엔진 기본값)
 
         Returns:
             해당 타입의 제너레이터 인스턴스
@@ -32,14 +33,30 @@ class GeneratorFactory:
         Raises:
             ValueError: 지원하지 않는 템플릿 타입인 경우
         """
-        if template_type not in cls._generators:
-            available = ", ".join(cls._generators.keys())
+        generator_class = cls.get_generator_class(template_type)
+        return generator_class(max_workers=max_workers)
+
+    @classmethod
+    def get_generator_class(cls, template_type: str) -> type["BaseGenerator"]:
+        """템플릿 타입에 해당하는 제너레이터 클래스를 임포트하여 반환합니다.
+
+        Raises:
+            ValueError: 지원하지 않는 템플릿 타입인 경우
+        """
+        if template_type in cls._resolved:
+            return cls._resolved[template_type]
+
+        registry = load_registry()
+        if template_type not in registry:
+            available = ", ".join(registry.keys())
             raise ValueError(f"지원하지 않는 템플릿 타입: {template_type}. 사용 가능한 타입: {available}")
 
-        generator_class = cls._generators[template_type]
-        return generator_class()
+        module_name, class_name = registry[template_type].split(":")
+        generator_class: type[BaseGenerator] = getattr(import_module(module_name, __package__), class_name)
+        cls._resolved[template_type] = generator_class
+        return generator_class
 
     @classmethod
     def get_available_types(cls) -> list[str]:
-        """사용 가능한 템플릿 타입 목록을 반환합니다."""
-        return list(cls._generators.keys())
+        """플러그인을 포함한 사용 가능한 템플릿 타입 목록을 반환합니다."""
+        return list(load_registry().keys())
@@ -0,0 +1,108 @@
+"""제너레이터 플러그인 레지스트리 모듈.
+
+기본 제공 제너레이터에 더해 ``litestar_boilerplate.generators`` 엔트리 포인트 그룹으로 등록된
+외부 패키지의 제너레이터를 찾습니다. 엔트리 포인트 검색 결과는 설치된 배포판이 바뀌지 않는 한
+디스크에 캐시되어, CLI 실행마다 ``importlib.metadata`` 검색을 반복하지 않습니다.
+
+플러그인 패키지는 ``pyproject.toml``에 다음과 같이 등록합니다::
+
+    [project.entry-points."litestar_boilerplate.generators"]
+    my-template = "my_package.generator:MyGenerator"
+"""
+
+import hashlib
+import json
+import os
+import sys
+from functools import lru_cache
+from typing import Final
+
+from ..cache import get_cache_dir
+
+ENTRY_POINT_GROUP: Final[str] = "litestar_boilerplate.generators"
+
+# 기본 제공 제너레이터 (``모듈:클래스``, 모듈 경로는 이 패키지 기준 상대 경로)
+BUILTIN_GENERATORS: Final[dict[str, str]] = {
+    "layered": ".layered:LayeredGenerator",
+    "ddd-lite": ".ddd_lite:DddLiteGenerator",
+    "feature-based": ".feature_based:FeatureBasedGenerator",
+}
+
+# 엔트리 포인트 검색 결과 캐시 파일명 (가상환경마다 ``sys.prefix`` 해시로 구분)
+REGISTRY_CACHE_FILENAME: Final[str] = "generators-{environment}.json"
+
+
+@lru_cache(maxsize=1)
+def load_registry() -> dict[str, str]:
+    """템플릿 타입별 제너레이터 ``모듈:클래스`` 경로를 반환합니다 (캐시됨).
+
+    기본 제공 제너레이터가 먼저 오며, 같은 이름의 플러그인은 무시됩니다.
+    """
+    registry = dict(BUILTIN_GENERATORS)
+    for name, value in discover_plugins().items():
+        registry.setdefault(name, value)
+    return registry
+
+
+def discover_plugins() -> dict[str, str]:
+    """엔트리 포인트로 등록된 플러그인 제너레이터를 반환합니다.
+
+    설치된 배포판 상태가 캐시 키와 같으면 디스크 캐시를 사용하고, 다르면 엔트리 포인트를
+    다시 검색하여 캐시를 갱신합니다.
+    """
+    key = _environment_key()
+    cache_dir = get_cache_dir("plugins")
+    cache_file = cache_dir / _cache_filename() if cache_dir else None
+
+    if cache_file is not None:
+        try:
+            cached = json.loads(cache_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            cached = None
+        if isinstance(cached, dict) and cached.get("key") == key:
+            generators = cached.get("generators")
+            # 손상되었거나 다른 버전이 기록한 캐시는 캐시 미스로 처리합니다
+            if isinstance(generators, dict) and all(isinstance(k, str) and isinstance(v, str) for k, v in generators.items()):
+                return generators
+
+    from importlib.metadata import entry_points
+
+    plugins = {entry_point.name: entry_point.value for entry_point in entry_points(group=ENTRY_POINT_GROUP)}
+
+    if cache_file is not None:
+        try:
+            cache_file.write_text(json.dumps({"key": key, "generators": plugins}, indent=2), encoding="utf-8")
+        except OSError:
+            pass
+    return plugins
+
+
+def _cache_filename() -> str:
+    """현재 가상환경의 캐시 파일명을 반환합니다.
+
+    캐시 디렉토리는 모든 가상환경이 공유하므로, 환경마다 다른 파일을 사용하여 서로의 캐시를
+    덮어쓰지 않도록 합니다.
+    """
+    environment = hashlib.sha256(sys.prefix.encode()).hexdigest()[:16]
+    return REGISTRY_CACHE_FILENAME.format(environment=environment)
+
+
+def _environment_key() -> str:
+    """설치된 배포판 상태를 나타내는 캐시 키를 만듭니다.
+
+    패키지를 설치하거나 제거하면 ``sys.path`` 디렉토리(site-packages 등)에 ``*.dist-info``가
+    추가/삭제되어 디렉토리 수정 시각이 바뀌므로, 배포판 메타데이터를 읽지 않고 각 디렉토리의
+    수정 시각만으로 변경 여부를 판단합니다. 프로젝트를 생성하면서 수시로 바뀌는 현재 디렉토리는
+    키에서 제외합니다.
+    """
+    cwd = os.getcwd()
+    digest = hashlib.sha256(sys.version.encode())
+    for entry in sys.path:
+        if not entry or entry == cwd:
+            continue
+        try:
+            mtime_ns = os.stat(entry).st_mtime_ns
+        except OSError:
+            continue
+        digest.update(f"{entry}\0{mtime_ns}\0".encode())
+    return digest.hexdigest()
@@ -0,0 +1,41 @@
+"""Jinja2 템플릿 저장소 모듈.
+
+생성되는 파일 내용은 ``litestar_boilerplate/templates`` 패키지의 Jinja2 템플릿으로 관리됩니다.
+템플릿 환경은 프로세스당 한 번만 만들어지며, 컴파일된 템플릿은 메모리와 디스크 바이트코드
+캐시에 보관되어 여러 프로젝트를 생성할 때 재사용됩니다.
+"""
+
+from functools import lru_cache
+from typing import Any
+
+from jinja2 import Environment, FileSystemBytecodeCache, PackageLoader, StrictUndefined
+
+from ..cache import get_cache_dir
+
+
+@lru_cache(maxsize=1)
+def get_environment() -> Environment:
+    """템플릿 환경을 반환합니다 (캐시됨)."""
+    cache_dir = get_cache_dir("jinja")
+    return Environment(
+        loader=PackageLoader("litestar_boilerplate", "templates"),
+        bytecode_cache=FileSystemBytecodeCache(str(cache_dir)) if cache_dir else None,
+        undefined=StrictUndefined,
+        keep_trailing_newline=True,
+        auto_reload=False,
+        # HTML이 아닌 파이썬 소스를 생성하므로 이스케이프하지 않습니다
+        autoescape=False,  # noqa: S701
+    )
+
+
+def render_template(name: str, **context: Any) -> str:
+    """템플릿을 렌더링합니다.
+
+    Args:
+        name: ``templates`` 디렉토리 기준 템플릿 경로 (예: ``layered/package/app.py.jinja``)
+        context: 템플릿 변수
+
+    Returns:
+        렌더링된 파일 내용
+    """
+    return get_environment().get_template(name).render(**context)
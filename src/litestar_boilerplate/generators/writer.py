@@ -0,0 +1,244 @@
+"""프로젝트 파일 쓰기 엔진."""
+
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Final
+from uuid import uuid4
+
+# 파일 쓰기 스레드 풀의 기본 워커 수 (I/O 바운드 작업 기준)
+DEFAULT_MAX_WORKERS: Final[int] = min(32, (os.cpu_count() or 1) + 4)
+
+# 증분 갱신에 사용하는 파일 해시 매니페스트 파일명
+MANIFEST_FILENAME: Final[str] = ".litestar-boilerplate.json"
+
+# 치워 둔 기존 디렉토리를 삭제하는 분리된 프로세스의 스크립트
+_REMOVE_SCRIPT: Final[str] = "import shutil, sys; shutil.rmtree(sys.argv[1], ignore_errors=True)"
+
+
+def content_digest(content: bytes) -> str:
+    """파일 내용의 SHA-256 해시를 반환합니다."""
+    return hashlib.sha256(content).hexdigest()
+
+
+@dataclass
+class SyncReport:
+    """증분 갱신 결과."""
+
+    created: list[Path] = field(default_factory=list)
+    updated: list[Path] = field(default_factory=list)
+    unchanged: list[Path] = field(default_factory=list)
+
+    @property
+    def written(self) -> list[Path]:
+        """실제로 기록된 파일 목록을 반환합니다."""
+        return self.created + self.updated
+
+
+class RenderPlan:
+    """디스크에 기록할 디렉토리와 파일 목록.
+
+    모든 경로는 ``root`` 기준 상대 경로로 저장되며, 파일 내용은 UTF-8 바이트로 보관됩니다.
+    """
+
+    def __init__(self, root: Path) -> None:
+        """렌더 계획을 초기화합니다.
+
+        Args:
+            root: 프로젝트 루트 경로
+        """
+        self.root = root
+        self.directories: set[Path] = set()
+        self.files: dict[Path, bytes] = {}
+
+    def add_directory(self, path: Path) -> None:
+        """디렉토리를 계획에 추가합니다."""
+        self.directories.add(path.relative_to(self.root))
+
+    def add_file(self, path: Path, content: str | None) -> None:
+        """파일을 계획에 추가합니다.
+
+        Args:
+            path: 파일 경로
+            content: 파일 내용. ``None``이면 빈 파일이며, 이미 계획된 내용은 유지됩니다.
+        """
+        relative_path = path.relative_to(self.root)
+        if content is None:
+            self.files.setdefault(relative_path, b"")
+        else:
+            self.files[relative_path] = content.encode("utf-8")
+
+    def iter_directories(self) -> list[Path]:
+        """생성해야 할 모든 디렉토리를 상위 디렉토리부터 순서대로 반환합니다."""
+        directories = set(self.directories)
+        for file_path in self.files:
+            directories.update(file_path.parents)
+        directories.discard(Path("."))
+        return sorted(directories, key=lambda path: (len(path.parts), path))
+
+
+class FileWriter:
+    """렌더 계획을 디스크에 기록하는 쓰기 엔진.
+
+    디렉토리는 한 번씩만 생성하고, 파일 내용은 스레드 풀을 통해 병렬로 기록합니다.
+    ``commit``은 임시 디렉토리에 먼저 기록한 뒤 이름 변경으로 교체하므로 반쯤 생성된
+    디렉토리가 남지 않습니다.
+    """
+
+    def __init__(self, max_workers: int | None = None) -> None:
+        """쓰기 엔진을 초기화합니다.
+
+        Args:
+            max_workers: 파일 쓰기 워커 수 (기본값: ``DEFAULT_MAX_WORKERS``)
+        """
+        self.max_workers = max_workers or DEFAULT_MAX_WORKERS
+
+    def write(self, plan: RenderPlan, root: Path | None = None) -> None:
+        """렌더 계획을 디스크에 기록합니다.
+
+        Args:
+            plan: 기록할 렌더 계획
+            root: 기록할 루트 경로 (기본값: ``plan.root``)
+        """
+        target = root or plan.root
+        self._create_directories(plan, target)
+        self._write_files([(target / path, content) for path, content in plan.files.items()])
+
+    def commit(self, plan: RenderPlan) -> "subprocess.Popen[bytes] | None":
+        """렌더 계획을 임시 형제 디렉토리에 기록한 뒤 원자적으로 교체합니다.
+
+        기록 도중 실패하면 기존 디렉토리는 그대로 유지됩니다. 기존 디렉토리는 이름을 바꿔
+        치운 뒤 분리된 프로세스에서 삭제하므로, CLI는 삭제가 끝나기를 기다리지 않고 종료합니다.
+
+        Args:
+            plan: 기록할 렌더 계획
+
+        Returns:
+            기존 디렉토리를 삭제하는 프로세스 (기존 디렉토리가 없었거나 직접 삭제했다면 ``None``)
+        """
+        target = plan.root
+        target.parent.mkdir(parents=True, exist_ok=True)
+
+        token = uuid4().hex[:8]
+        staging = target.with_name(f".{target.name}.{token}.tmp")
+        try:
+            self.write(plan, staging)
+        except BaseException:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+
+        if not target.exists():
+            os.replace(staging, target)
+            return None
+
+        backup = target.with_name(f".{target.name}.{token}.old")
+        os.replace(target, backup)
+        try:
+            os.replace(staging, target)
+        except BaseException:
+            # 교체에 실패하면 기존 디렉토리를 복원합니다
+            os.replace(backup, target)
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+
+        return _remove_detached(backup)
+
+    def sync(self, plan: RenderPlan) -> SyncReport:
+        """내용이 바뀐 파일만 기록하는 증분 갱신을 수행합니다.
+
+        렌더링된 내용을 디스크의 파일과 비교하여 새 파일과 변경된 파일만 다시 기록하므로,
+        변경되지 않은 파일의 수정 시각이 유지됩니다. 이전 실행에서 저장한 매니페스트의 해시,
+        크기, 수정 시각이 모두 일치하면 파일을 읽지 않고 건너뜁니다. 계획에 없는 기존 파일은
+        삭제하지 않습니다.
+
+        Args:
+            plan: 기록할 렌더 계획
+
+        Returns:
+            새 파일, 변경된 파일, 건너뛴 파일 목록
+        """
+        target = plan.root
+        manifest = self._load_manifest(target)
+        report = SyncReport()
+        digests: dict[Path, str] = {}
+
+        for path, content in plan.files.items():
+            digest = digests[path] = content_digest(content)
+            file_path = target / path
+            try:
+                stat = file_path.stat()
+            except FileNotFoundError:
+                report.created.append(path)
+                continue
+
+            entry = manifest.get(path.as_posix())
+            if entry == {"sha256": digest, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}:
+                report.unchanged.append(path)
+            elif stat.st_size == len(content) and file_path.read_bytes() == content:
+                report.unchanged.append(path)
+            else:
+                report.updated.append(path)
+
+        self._create_directories(plan, target)
+        self._write_files([(target / path, plan.files[path]) for path in report.written])
+        self._save_manifest(target, digests)
+        return report
+
+    def _create_directories(self, plan: RenderPlan, target: Path) -> None:
+        """렌더 계획의 모든 디렉토리를 한 번씩 생성합니다."""
+        target.mkdir(parents=True, exist_ok=True)
+        for directory in plan.iter_directories():
+            (target / directory).mkdir(exist_ok=True)
+
+    def _write_files(self, items: list[tuple[Path, bytes]]) -> None:
+        """파일 내용을 스레드 풀을 통해 기록합니다."""
+        if self.max_workers == 1 or len(items) <= 1:
+            for path, content in items:
+                path.write_bytes(content)
+            return
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            # 예외를 호출자에게 전파하기 위해 결과를 모두 소비합니다
+            list(executor.map(lambda item: item[0].write_bytes(item[1]), items))
+
+    def _load_manifest(self, target: Path) -> dict[str, Any]:
+        """저장된 파일 해시 매니페스트를 읽습니다."""
+        try:
+            data = json.loads((target / MANIFEST_FILENAME).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        files = data.get("files") if isinstance(data, dict) else None
+        return files if isinstance(files, dict) else {}
+
+    def _save_manifest(self, target: Path, digests: dict[Path, str]) -> None:
+        """파일 해시 매니페스트를 저장합니다."""
+        files: dict[str, Any] = {}
+        for path, digest in sorted(digests.items()):
+            stat = (target / path).stat()
+            files[path.as_posix()] = {"sha256": digest, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+        content = json.dumps({"version": 1, "files": files}, indent=2, ensure_ascii=False) + "\n"
+        (target / MANIFEST_FILENAME).write_text(content, encoding="utf-8")
+
+
+def _remove_detached(path: Path) -> "subprocess.Popen[bytes] | None":
+    """디렉토리를 현재 프로세스와 분리된 프로세스에서 삭제합니다.
+
+    스레드와 달리 인터프리터가 종료될 때 삭제가 끝나기를 기다리지 않습니다. 프로세스를 시작할 수
+    없으면 직접 삭제합니다.
+    """
+    options: dict[str, Any] = {"stdin": subprocess.DEVNULL, "stdout": subprocess.DEVNULL, "stderr": subprocess.DEVNULL}
+    if sys.platform == "win32":
+        options["creationflags"] = subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP
+    else:
+        options["start_new_session"] = True
+    try:
+        return subprocess.Popen([sys.executable, "-c", _REMOVE_SCRIPT, str(path)], **options)
+    except OSError:
+        shutil.rmtree(path, ignore_errors=True)
+        return None
@@ -1,7 +1,8 @@
 """다국어 지원 모듈."""
 
 from enum import Enum
-from typing import Any
+from string import Formatter
+from typing import Any, TypeAlias, cast
 
 
 class Language(str, Enum):
@@ -79,6 +80,15 @@ MESSAGES_KO: dict[str, Any] = {
         "setup_env": "환경변수 설정: cp .env.example .env",
         "run_migrations": "데이터베이스 마이그레이션: alembic upgrade head",
         "start_server": "서버 실행: litestar run --reload",
+        "project_updated": "🔁 프로젝트가 증분 갱신되었습니다",
+        "update_summary": "새 파일 {created}개, 변경된 파일 {updated}개, 건너뛴 파일 {unchanged}개",
+        "batch_started": "📦 매니페스트의 프로젝트 {count}개를 일괄 생성하는 중...",
+        "batch_summary": "📊 일괄 생성 결과",
+        "batch_project": "프로젝트",
+        "batch_template": "템플릿",
+        "batch_status": "상태",
+        "batch_duration": "소요 시간",
+        "batch_completed": "성공 {succeeded}개, 실패 {failed}개 (총 {elapsed:.2f}초)",
     },
     "readme": {
         "title": "Litestar 보일러플레이트 컬렉션",
@@ -260,6 +270,15 @@ MESSAGES_EN: dict[str, Any] = {
         "setup_env": "Setup environment: cp .env.example .env",
         "run_migrations": "Run migrations: alembic upgrade head",
         "start_server": "Start server: litestar run --reload",
+        "project_updated": "🔁 Project updated incrementally",
+        "update_summary": "{created} new, {updated} changed, {unchanged} skipped",
+        "batch_started": "📦 Generating {count} projects from manifest...",
+        "batch_summary": "📊 Batch generation results",
+        "batch_project": "Project",
+        "batch_template": "Template",
+        "batch_status": "Status",
+        "batch_duration": "Duration",
+        "batch_completed": "{succeeded} succeeded, {failed} failed ({elapsed:.2f}s total)",
     },
     "readme": {
         "title": "Litestar Boilerplate Collection",
@@ -348,26 +367,82 @@ MESSAGES = {
 }
 
 
+# 평탄화된 카탈로그의 값: 메시지, 메시지 목록(features 등) 또는 중간 경로의 하위 딕셔너리
+Message: TypeAlias = str | list[str] | dict[str, Any]
+Catalog: TypeAlias = dict[str, Message]
+
+
+def flatten_messages(messages: dict[str, Any], prefix: str = "") -> Catalog:
+    """중첩된 메시지 딕셔너리를 점으로 구분된 전체 키 기준의 평탄한 딕셔너리로 변환합니다.
+
+    ``t("templates.layered")``처럼 중간 경로를 조회하는 경우를 위해 하위 딕셔너리도 함께 담습니다.
+    """
+    flat: Catalog = {}
+    for key, value in messages.items():
+        full_key = f"{prefix}{key}"
+        flat[full_key] = value
+        if isinstance(value, dict):
+            flat.update(flatten_messages(value, f"{full_key}."))
+    return flat
+
+
+def _format_fields(message: str) -> frozenset[str]:
+    """메시지의 포맷 필드 이름을 반환합니다."""
+    return frozenset(field for _, field, _, _ in Formatter().parse(message) if field is not None)
+
+
+def _compile_catalogs() -> tuple[dict[Language, Catalog], dict[Language, frozenset[str]]]:
+    """언어별 평탄화된 메시지 카탈로그와 포맷 템플릿 키 목록을 만듭니다.
+
+    Raises:
+        ValueError: 언어 간 메시지 키 또는 포맷 필드가 일치하지 않는 경우
+    """
+    catalogs = {language: flatten_messages(messages) for language, messages in MESSAGES.items()}
+    templates: dict[Language, frozenset[str]] = {}
+    fields: dict[Language, dict[str, frozenset[str]]] = {}
+    for language, catalog in catalogs.items():
+        fields[language] = {key: _format_fields(value) for key, value in catalog.items() if isinstance(value, str)}
+        templates[language] = frozenset(key for key, names in fields[language].items() if names)
+
+    problems: list[str] = []
+    reference, *others = catalogs
+    for language in others:
+        for key in sorted(catalogs[reference].keys() ^ catalogs[language].keys()):
+            owner = reference if key in catalogs[reference] else language
+            problems.append(f"'{key}' exists only in {owner.value}")
+        for key in sorted(fields[reference].keys() & fields[language].keys()):
+            if fields[reference][key] != fields[language][key]:
+                problems.append(f"'{key}' has different format fields in {reference.value} and {language.value}")
+    if problems:
+        raise ValueError("메시지 카탈로그가 언어 간에 일치하지 않습니다: " + "; ".join(problems))
+
+    return catalogs, templates
+
+
+# 언어별 평탄화된 메시지 카탈로그 (모듈 임포트 시 한 번만 생성)
+CATALOGS, _FORMAT_TEMPLATES = _compile_catalogs()
+
+
 class I18n:
     """다국어 지원 클래스."""
 
     def __init__(self, language: Language = Language.KOREAN):
         """I18n 인스턴스를 초기화합니다."""
-        self.language = language
-        self.messages = MESSAGES[language]
+        self.set_language(language)
 
-    def get(self, key: str, **kwargs) -> str:
-        """메시지를 가져옵니다."""
-        keys = key.split(".")
-        value = self.messages
+    def get(self, key: str, **kwargs: Any) -> str:
+        """메시지를 가져옵니다.
 
-        for k in keys:
-            if isinstance(value, dict) and k in value:
-                value = value[k]
-            else:
-                return f"Missing translation: {key}"
+        목록(``features`` 등)이나 하위 딕셔너리 키는 값을 그대로 반환하며, 호출자가 키에 맞는
+        타입으로 사용합니다.
+        """
+        value = self.catalog.get(key)
+        if value is None:
+            return f"Missing translation: {key}"
+        if not isinstance(value, str):
+            return cast(str, value)
 
-        if isinstance(value, str) and kwargs:
+        if kwargs and key in self._templates:
             return value.format(**kwargs)
 
         return value
@@ -376,6 +451,8 @@ class I18n:
         """언어를 변경합니다."""
         self.language = language
         self.messages = MESSAGES[language]
+        self.catalog = CATALOGS[language]
+        self._templates = _FORMAT_TEMPLATES[language]
 
 
 # 전역 인스턴스
@@ -387,7 +464,7 @@ def get_i18n() -> I18n:
     return _i18n
 
 
-def t(key: str, **kwargs) -> str:
+def t(key: str, **kwargs: Any) -> str:
     """메시지를 번역합니다."""
     return _i18n.get(key, **kwargs)
 
@@ -1,31 +1,48 @@
 """README 생성기 모듈."""
 
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Final
 
-from .i18n import Language, get_i18n, t
+from .i18n import I18n, Language
+
+# GitHub 표준 언어별 README 파일명
+README_FILENAMES: Final[dict[Language, str]] = {
+    Language.ENGLISH: "README.md",
+    Language.KOREAN: "README.ko.md",
+}
 
 
 class ReadmeGenerator:
-    """README 파일 생성기."""
+    """README 파일 생성기.
+
+    전역 언어 설정을 바꾸지 않고 생성기마다 언어가 고정된 번역기를 사용하므로, 여러 언어의
+    README를 동시에 렌더링할 수 있습니다.
+    """
+
+    def __init__(self, language: Language = Language.KOREAN, translator: I18n | None = None):
+        """README 생성기를 초기화합니다.
 
-    def __init__(self, language: Language = Language.KOREAN):
-        """README 생성기를 초기화합니다."""
+        Args:
+            language: README 언어
+            translator: 사용할 번역기 (기본값: ``language``에 고정된 새 번역기)
+        """
         self.language = language
-        self.i18n = get_i18n()
-        self.i18n.set_language(language)
+        self.i18n = translator or I18n(language)
+        self.t = self.i18n.get
 
     def generate_main_readme(self, output_path: Path | None = None) -> str:
-        """메인 README 내용을 생성합니다."""
+        """메인 README 내용을 생성합니다.
+
+        ``output_path``가 주어지면 파일로 기록하되, 디스크의 내용과 같으면 다시 기록하지 않습니다.
+        """
         content = self._generate_readme_content()
 
         if output_path:
             # 출력 디렉토리가 없으면 생성
             output_path.mkdir(parents=True, exist_ok=True)
-
-            # GitHub 표준 언어별 README 파일명 결정
-            filename = "README.md" if self.language == Language.ENGLISH else "README.ko.md"
-            readme_path = output_path / filename
-            readme_path.write_text(content, encoding="utf-8")
+            write_if_changed(output_path / README_FILENAMES[self.language], content)
 
         return content
 
@@ -33,55 +50,55 @@ class ReadmeGenerator:
         """README 내용을 생성합니다."""
         return f"""{self._get_language_selector()}
 
-# {t("readme.title")}
+# {self.t("readme.title")}
 
-{t("readme.subtitle")}
+{self.t("readme.subtitle")}
 
 {self._format_badges()}
 
-{t("readme.description")}
+{self.t("readme.description")}
 
-{t("readme.key_features")}
+{self.t("readme.key_features")}
 
-{self._format_feature_points(t("readme.key_features_list"))}
+{self._format_feature_points(self.t("readme.key_features_list"))}
 
-{t("readme.architecture_types")}
+{self.t("readme.architecture_types")}
 
-### 1. {t("readme.features.layered.title")} (`layered/`)
-{t("readme.features.layered.subtitle")}
-{self._format_feature_points(t("readme.features.layered.points"))}
+### 1. {self.t("readme.features.layered.title")} (`layered/`)
+{self.t("readme.features.layered.subtitle")}
+{self._format_feature_points(self.t("readme.features.layered.points"))}
 
-### 2. {t("readme.features.ddd-lite.title")} (`ddd-lite/`)
-{t("readme.features.ddd-lite.subtitle")}
-{self._format_feature_points(t("readme.features.ddd-lite.points"))}
+### 2. {self.t("readme.features.ddd-lite.title")} (`ddd-lite/`)
+{self.t("readme.features.ddd-lite.subtitle")}
+{self._format_feature_points(self.t("readme.features.ddd-lite.points"))}
 
-### 3. {t("readme.features.feature-based.title")} (`feature-based/`)
-{t("readme.features.feature-based.subtitle")}
-{self._format_feature_points(t("readme.features.feature-based.points"))}
+### 3. {self.t("readme.features.feature-based.title")} (`feature-based/`)
+{self.t("readme.features.feature-based.subtitle")}
+{self._format_feature_points(self.t("readme.features.feature-based.points"))}
 
-{t("readme.usage")}
+{self.t("readme.usage")}
 
 ```bash
-# {t("readme.install_cli")}
+# {self.t("readme.install_cli")}
 pip install -e .
 
-# {t("readme.create_project")}
+# {self.t("readme.create_project")}
 litestar-boilerplate create --type layered --name my-project
 litestar-boilerplate create --type ddd-lite --name my-project
 litestar-boilerplate create --type feature-based --name my-project
 
-# {t("readme.list_templates")}
+# {self.t("readme.list_templates")}
 litestar-boilerplate list-templates
 
-# {t("readme.help")}
+# {self.t("readme.help")}
 litestar-boilerplate --help
 ```
 
-{t("readme.language_support")}
+{self.t("readme.language_support")}
 
 {self._get_language_support_section()}
 
-{t("readme.requirements")}
+{self.t("readme.requirements")}
 
 - Python 3.11+
 - Litestar 2.0+
@@ -89,31 +106,31 @@ litestar-boilerplate --help
 - Alembic
 - Pydantic V2
 
-{t("readme.dev_setup")}
+{self.t("readme.dev_setup")}
 
 ```bash
-# {t("readme.create_venv")}
+# {self.t("readme.create_venv")}
 python -m venv venv
 source venv/bin/activate  # Linux/Mac
 # venv\\Scripts\\activate  # Windows
 
-# {t("readme.install_deps")}
-{t("readme.install_cmd")}
+# {self.t("readme.install_deps")}
+{self.t("readme.install_cmd")}
 ```
 
-{t("readme.litestar_resources")}
+{self.t("readme.litestar_resources")}
 
 {self._format_litestar_resources()}
 
-{t("readme.detailed_docs")}
+{self.t("readme.detailed_docs")}
 
-{t("readme.contributing")}
+{self.t("readme.contributing")}
 
-{t("readme.contributing_content")}
+{self.t("readme.contributing_content")}
 
-{t("readme.license")}
+{self.t("readme.license")}
 
-{t("readme.license_content")}
+{self.t("readme.license_content")}
 """
 
     def _get_language_selector(self) -> str:
@@ -172,24 +189,51 @@ litestar-boilerplate -l ko create --type layered --name my-app
 
     def _format_litestar_resources(self) -> str:
         """Litestar 리소스 섹션을 포맷팅합니다."""
-        resources = t("readme.litestar_resources_content")
+        resources = self.t("readme.litestar_resources_content")
         return "\n".join(resources)
 
     def _format_badges(self) -> str:
         """배지 섹션을 포맷팅합니다."""
-        badges = t("readme.badges")
+        badges = self.t("readme.badges")
         return "\n".join(badges)
 
 
-def generate_readme_files(output_path: Path) -> None:
-    """GitHub 표준 다국어 README 파일을 생성합니다."""
+def write_if_changed(path: Path, content: str) -> bool:
+    """내용이 바뀐 경우에만 파일을 기록합니다.
+
+    Returns:
+        파일을 기록했는지 여부
+    """
+    data = content.encode("utf-8")
+    try:
+        if path.stat().st_size == len(data) and path.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
+    path.write_bytes(data)
+    return True
+
+
+def generate_readme_files(output_path: Path, languages: Iterable[Language] = README_FILENAMES) -> list[Path]:
+    """GitHub 표준 다국어 README 파일을 생성합니다.
+
+    언어별 README를 동시에 렌더링하며, 내용이 바뀌지 않은 파일은 다시 기록하지 않습니다.
+
+    Args:
+        output_path: README 파일을 생성할 디렉토리
+        languages: 생성할 언어 목록 (기본값: 지원하는 모든 언어)
+
+    Returns:
+        실제로 기록된 README 파일 경로 목록
+    """
     # 출력 디렉토리가 없으면 생성
     output_path.mkdir(parents=True, exist_ok=True)
 
-    # 영어 README 생성 (GitHub 기본)
-    en_generator = ReadmeGenerator(Language.ENGLISH)
-    en_generator.generate_main_readme(output_path)
+    def render(language: Language) -> Path | None:
+        content = ReadmeGenerator(language).generate_main_readme()
+        readme_path = output_path / README_FILENAMES[language]
+        return readme_path if write_if_changed(readme_path, content) else None
 
-    # 한국어 README 생성
-    ko_generator = ReadmeGenerator(Language.KOREAN)
-    ko_generator.generate_main_readme(output_path)
+    languages = list(languages)
+    with ThreadPoolExecutor(max_workers=len(languages) or 1) as executor:
+        return [path for path in executor.map(render, languages) if path is not None]
@@ -0,0 +1,13 @@
+"""테스트 설정."""
+
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path_factory: pytest.TempPathFactory, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """사용자 캐시 디렉토리 대신 테스트마다 새 임시 디렉토리를 사용합니다."""
+    path = tmp_path_factory.mktemp("cache")
+    monkeypatch.setenv("LITESTAR_BOILERPLATE_CACHE_DIR", str(path))
+    return path
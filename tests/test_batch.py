@@ -0,0 +1,76 @@
+"""매니페스트 기반 일괄 생성 테스트."""
+
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from litestar_boilerplate.batch import load_batch_manifest
+
+
+def write_manifest(tmp_path: Path, projects: list[dict[str, Any]]) -> Path:
+    """JSON 매니페스트 파일을 만듭니다."""
+    manifest = tmp_path / "projects.json"
+    manifest.write_text(json.dumps({"projects": projects}), encoding="utf-8")
+    return manifest
+
+
+class TestLoadBatchManifest:
+    """``load_batch_manifest`` 테스트."""
+
+    def test_load_manifest(self, tmp_path: Path) -> None:
+        """항목을 읽고 상대 출력 경로를 매니페스트 위치 기준으로 해석하는지 테스트."""
+        manifest = write_manifest(
+            tmp_path,
+            [
+                {"name": "api", "type": "layered", "output": "services", "options": {"force": True}},
+                {"name": "shop", "type": "ddd-lite"},
+            ],
+        )
+
+        entries = load_batch_manifest(manifest)
+        assert [(entry.name, entry.template_type) for entry in entries] == [("api", "layered"), ("shop", "ddd-lite")]
+        assert entries[0].output_path == tmp_path / "services" / "api"
+        assert entries[0].options == {"force": True}
+        assert entries[1].output_path == tmp_path / "." / "shop"
+
+    def test_load_toml_manifest(self, tmp_path: Path) -> None:
+        """TOML 매니페스트를 읽는지 테스트."""
+        manifest = tmp_path / "projects.toml"
+        manifest.write_text('[[projects]]\nname = "api"\ntype = "feature-based"\n', encoding="utf-8")
+
+        entries = load_batch_manifest(manifest)
+        assert [(entry.name, entry.template_type) for entry in entries] == [("api", "feature-based")]
+
+    def test_rejects_duplicate_output_paths(self, tmp_path: Path) -> None:
+        """같은 경로로 생성되는 항목이 있으면 거부하는지 테스트."""
+        manifest = write_manifest(
+            tmp_path,
+            [
+                {"name": "api", "type": "layered", "output": "out"},
+                {"name": "api", "type": "ddd-lite", "output": "./out/../out"},
+            ],
+        )
+
+        with pytest.raises(ValueError, match="중복"):
+            load_batch_manifest(manifest)
+
+    def test_rejects_unknown_options(self, tmp_path: Path) -> None:
+        """지원하지 않는 옵션이 있으면 거부하는지 테스트."""
+        manifest = write_manifest(tmp_path, [{"name": "api", "type": "layered", "options": {"force": True, "dry_run": True}}])
+
+        with pytest.raises(ValueError, match="dry_run"):
+            load_batch_manifest(manifest)
+
+    def test_rejects_unknown_template_type(self, tmp_path: Path) -> None:
+        """지원하지 않는 템플릿 타입이면 거부하는지 테스트."""
+        manifest = write_manifest(tmp_path, [{"name": "api", "type": "unknown"}])
+
+        with pytest.raises(ValueError, match="unknown"):
+            load_batch_manifest(manifest)
+
+    def test_rejects_empty_manifest(self, tmp_path: Path) -> None:
+        """프로젝트 목록이 비어 있으면 거부하는지 테스트."""
+        with pytest.raises(ValueError, match="프로젝트 목록"):
+            load_batch_manifest(write_manifest(tmp_path, []))
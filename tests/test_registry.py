@@ -0,0 +1,99 @@
+"""제너레이터 플러그인 레지스트리 테스트."""
+
+import json
+import os
+from importlib import metadata
+from pathlib import Path
+
+import pytest
+
+from litestar_boilerplate.generators import registry
+
+
+class FakeEntryPoints:
+    """``importlib.metadata.entry_points`` 대체 (호출 횟수 기록)."""
+
+    def __init__(self, plugins: dict[str, str]) -> None:
+        """등록할 플러그인(이름 -> ``모듈:클래스``)으로 초기화합니다."""
+        self.plugins = plugins
+        self.calls = 0
+
+    def __call__(self, group: str) -> list[metadata.EntryPoint]:
+        self.calls += 1
+        return [metadata.EntryPoint(name=name, value=value, group=group) for name, value in self.plugins.items()]
+
+
+@pytest.fixture
+def entry_points(monkeypatch: pytest.MonkeyPatch) -> FakeEntryPoints:
+    """엔트리 포인트 검색을 대체합니다."""
+    fake = FakeEntryPoints({"custom": "my_plugin:CustomGenerator"})
+    monkeypatch.setattr(metadata, "entry_points", fake)
+    return fake
+
+
+class TestDiscoverPlugins:
+    """``discover_plugins`` 테스트."""
+
+    def test_uses_cache_while_environment_unchanged(self, entry_points: FakeEntryPoints) -> None:
+        """설치 상태가 같으면 엔트리 포인트를 다시 검색하지 않는지 테스트."""
+        assert registry.discover_plugins() == {"custom": "my_plugin:CustomGenerator"}
+
+        entry_points.plugins = {"other": "other_plugin:OtherGenerator"}
+        assert registry.discover_plugins() == {"custom": "my_plugin:CustomGenerator"}
+        assert entry_points.calls == 1
+
+    def test_invalidates_cache_when_sys_path_changes(
+        self, entry_points: FakeEntryPoints, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """``sys.path``가 바뀌면 캐시를 버리고 다시 검색하는지 테스트."""
+        registry.discover_plugins()
+        entry_points.plugins = {"other": "other_plugin:OtherGenerator"}
+
+        site_packages = tmp_path / "site-packages"
+        site_packages.mkdir()
+        monkeypatch.syspath_prepend(str(site_packages))
+
+        assert registry.discover_plugins() == {"other": "other_plugin:OtherGenerator"}
+        assert entry_points.calls == 2
+
+    def test_invalidates_cache_when_distribution_installed(
+        self, entry_points: FakeEntryPoints, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """``sys.path`` 디렉토리에 배포판이 추가되면 다시 검색하는지 테스트."""
+        site_packages = tmp_path / "site-packages"
+        site_packages.mkdir()
+        monkeypatch.syspath_prepend(str(site_packages))
+        registry.discover_plugins()
+
+        mtime_ns = site_packages.stat().st_mtime_ns
+        (site_packages / "other_plugin-1.0.dist-info").mkdir()
+        # 타임스탬프 해상도가 낮은 파일 시스템에서도 디렉토리 수정 시각이 바뀌도록 합니다
+        os.utime(site_packages, ns=(mtime_ns + 1_000_000_000, mtime_ns + 1_000_000_000))
+        entry_points.plugins = {"other": "other_plugin:OtherGenerator"}
+
+        assert registry.discover_plugins() == {"other": "other_plugin:OtherGenerator"}
+        assert entry_points.calls == 2
+
+    @pytest.mark.parametrize("generators", [["custom"], {"custom": 1}, None])
+    def test_ignores_invalid_cache(self, entry_points: FakeEntryPoints, cache_dir: Path, generators: object) -> None:
+        """형식이 올바르지 않은 캐시는 캐시 미스로 처리하는지 테스트."""
+        cache_file = cache_dir / "plugins" / registry._cache_filename()
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text(json.dumps({"key": registry._environment_key(), "generators": generators}), encoding="utf-8")
+
+        assert registry.discover_plugins() == {"custom": "my_plugin:CustomGenerator"}
+        assert entry_points.calls == 1
+
+
+def test_builtin_generators_take_precedence(entry_points: FakeEntryPoints) -> None:
+    """기본 제공 제너레이터와 같은 이름의 플러그인은 무시되는지 테스트."""
+    entry_points.plugins = {"layered": "evil:Generator", "custom": "my_plugin:CustomGenerator"}
+    registry.load_registry.cache_clear()
+    try:
+        loaded = registry.load_registry()
+    finally:
+        registry.load_registry.cache_clear()
+
+    assert loaded["layered"] == registry.BUILTIN_GENERATORS["layered"]
+    assert loaded["custom"] == "my_plugin:CustomGenerator"
+    assert list(loaded)[: len(registry.BUILTIN_GENERATORS)] == list(registry.BUILTIN_GENERATORS)
@@ -0,0 +1,127 @@
+"""파일 쓰기 엔진 테스트."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from litestar_boilerplate.generators.writer import FileWriter, RenderPlan
+
+
+def make_plan(root: Path, files: dict[str, str]) -> RenderPlan:
+    """``files``(상대 경로 -> 내용)로 렌더 계획을 만듭니다."""
+    plan = RenderPlan(root)
+    for path, content in files.items():
+        plan.add_file(root / path, content)
+    return plan
+
+
+def read_tree(root: Path) -> dict[str, str]:
+    """디렉토리의 모든 파일을 상대 경로 -> 내용으로 읽습니다."""
+    return {path.relative_to(root).as_posix(): path.read_text() for path in root.rglob("*") if path.is_file()}
+
+
+class TestFileWriterCommit:
+    """``FileWriter.commit`` 테스트."""
+
+    def test_commit_creates_tree(self, tmp_path: Path) -> None:
+        """새 디렉토리에 계획을 기록하는지 테스트."""
+        root = tmp_path / "project"
+        FileWriter(max_workers=2).commit(make_plan(root, {"a.py": "a", "pkg/b.py": "b"}))
+
+        assert read_tree(root) == {"a.py": "a", "pkg/b.py": "b"}
+        assert [path.name for path in tmp_path.iterdir()] == ["project"]
+
+    def test_commit_replaces_existing_tree(self, tmp_path: Path) -> None:
+        """기존 디렉토리를 새 계획으로 교체하고 치운 디렉토리를 삭제하는지 테스트."""
+        root = tmp_path / "project"
+        FileWriter().commit(make_plan(root, {"old.py": "old"}))
+
+        cleanup = FileWriter().commit(make_plan(root, {"new.py": "new"}))
+        assert cleanup is not None
+        cleanup.wait(timeout=30)
+
+        assert read_tree(root) == {"new.py": "new"}
+        assert [path.name for path in tmp_path.iterdir()] == ["project"]
+
+    def test_commit_keeps_old_tree_when_write_fails(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """임시 디렉토리에 기록하다 실패하면 기존 디렉토리가 그대로 남는지 테스트."""
+        root = tmp_path / "project"
+        FileWriter().commit(make_plan(root, {"old.py": "old"}))
+
+        def fail(self: FileWriter, plan: RenderPlan, root: Path | None = None) -> None:
+            (root or plan.root).mkdir()
+            raise OSError("disk full")
+
+        monkeypatch.setattr(FileWriter, "write", fail)
+        with pytest.raises(OSError, match="disk full"):
+            FileWriter().commit(make_plan(root, {"new.py": "new"}))
+
+        assert read_tree(root) == {"old.py": "old"}
+        assert [path.name for path in tmp_path.iterdir()] == ["project"]
+
+    def test_commit_restores_old_tree_when_swap_fails(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """새 디렉토리로 교체하다 실패하면 기존 디렉토리를 복원하는지 테스트."""
+        root = tmp_path / "project"
+        FileWriter().commit(make_plan(root, {"old.py": "old"}))
+
+        real_replace = os.replace
+        calls = []
+
+        def replace(src: Path, dst: Path) -> None:
+            calls.append((Path(src).name, Path(dst).name))
+            # 기존 디렉토리를 치운 다음의 교체(임시 디렉토리 -> 대상)만 실패시킵니다
+            if len(calls) == 2:
+                raise OSError("rename failed")
+            real_replace(src, dst)
+
+        monkeypatch.setattr(os, "replace", replace)
+        with pytest.raises(OSError, match="rename failed"):
+            FileWriter().commit(make_plan(root, {"new.py": "new"}))
+
+        assert read_tree(root) == {"old.py": "old"}
+        assert [path.name for path in tmp_path.iterdir()] == ["project"]
+
+
+class TestFileWriterSync:
+    """``FileWriter.sync`` 테스트."""
+
+    def test_sync_counts_created_updated_unchanged(self, tmp_path: Path) -> None:
+        """새 파일, 변경된 파일, 변경되지 않은 파일을 구분하는지 테스트."""
+        root = tmp_path / "project"
+        report = FileWriter().sync(make_plan(root, {"a.py": "a", "b.py": "b"}))
+        assert sorted(report.created) == [Path("a.py"), Path("b.py")]
+        assert report.updated == []
+        assert report.unchanged == []
+
+        report = FileWriter().sync(make_plan(root, {"a.py": "a", "b.py": "b2", "c.py": "c"}))
+        assert report.created == [Path("c.py")]
+        assert report.updated == [Path("b.py")]
+        assert report.unchanged == [Path("a.py")]
+        assert sorted(report.written) == [Path("b.py"), Path("c.py")]
+        assert read_tree(root)["b.py"] == "b2"
+
+    def test_sync_keeps_mtime_of_unchanged_files(self, tmp_path: Path) -> None:
+        """변경되지 않은 파일은 다시 기록하지 않아 수정 시각이 유지되는지 테스트."""
+        root = tmp_path / "project"
+        files = {"a.py": "a", "pkg/b.py": "b"}
+        FileWriter().sync(make_plan(root, files))
+
+        # 다시 기록되면 수정 시각이 바뀌도록 과거 시각으로 되돌려 둡니다
+        for name in files:
+            os.utime(root / name, ns=(1_000_000_000, 1_000_000_000))
+
+        report = FileWriter().sync(make_plan(root, files))
+        assert sorted(report.unchanged) == [Path("a.py"), Path("pkg/b.py")]
+        assert report.written == []
+        assert all((root / name).stat().st_mtime_ns == 1_000_000_000 for name in files)
+
+    def test_sync_rewrites_file_edited_on_disk(self, tmp_path: Path) -> None:
+        """디스크에서 수정된 파일은 매니페스트와 달라 다시 기록하는지 테스트."""
+        root = tmp_path / "project"
+        FileWriter().sync(make_plan(root, {"a.py": "a"}))
+        (root / "a.py").write_text("edited")
+
+        report = FileWriter().sync(make_plan(root, {"a.py": "a"}))
+        assert report.updated == [Path("a.py")]
+        assert (root / "a.py").read_text() == "a"